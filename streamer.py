@@ -4,19 +4,42 @@
 PC বন্ধ থাকলেও চলবে!
 """
 
+import asyncio
 import subprocess
-import time
 import os
+import json
+import logging
+import re
 import sys
 import signal
+import shutil
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 
+# একটাই keep-alive connection - HEAD check, download আর retry সব এটা দিয়ে
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=1,
+    max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+
+log = logging.getLogger(__name__)
+
+# FFmpeg -progress block থেকে যে key গুলো দেখাবেন (এক regex scan এ)
+# (speed এর মতো কিছু value space-padded আসে: 'speed=   1x')
+STATUS_FIELD = re.compile(rb'^(frame|fps|bitrate|out_time|speed)=[ \t]*(\S*)', re.M)
+
 class YouTubeLiveStreamer:
     def __init__(self):
-        print("🎬 24/7 YouTube Live Streamer")
-        print("=" * 60)
-        print(f"⏰ Started at: {datetime.now()}")
+        log.info("🎬 24/7 YouTube Live Streamer")
+        log.info("=" * 60)
+        log.info(f"⏰ Started at: {datetime.now()}")
         
         # Environment variables থেকে settings
         self.stream_key = os.getenv('YOUTUBE_STREAM_KEY')
@@ -25,13 +48,13 @@ class YouTubeLiveStreamer:
         
         # Validate
         if not self.stream_key:
-            print("❌ YOUTUBE_STREAM_KEY missing!")
-            print("💡 Add it in GitHub Secrets!")
+            log.error("❌ YOUTUBE_STREAM_KEY missing!")
+            log.info("💡 Add it in GitHub Secrets!")
             sys.exit(1)
         
         if not self.video_url:
-            print("❌ VIDEO_URL missing!")
-            print("💡 Add it in GitHub Secrets!")
+            log.error("❌ VIDEO_URL missing!")
+            log.info("💡 Add it in GitHub Secrets!")
             sys.exit(1)
         
         # YouTube RTMP
@@ -47,105 +70,312 @@ class YouTubeLiveStreamer:
         
         self.settings = self.qualities.get(self.video_quality, self.qualities['720p'])
         
-        print(f"✅ Stream Key: {self.stream_key[:8]}...{self.stream_key[-4:]}")
-        print(f"✅ Video URL: {self.video_url[:50]}...")
-        print(f"✅ Quality: {self.video_quality}")
-        print("=" * 60)
+        # Derived encoder settings (একবারই হিসাব করুন)
+        bitrate_k = int(self.settings['bitrate'].rstrip('k'))
+        self.settings['bitrate_bps'] = bitrate_k * 1000
+        self.settings['bufsize'] = f"{bitrate_k * 2}k"
+        self.settings['gop'] = str(self.settings['fps'] * 2)
+        
+        # Hardware encoders (low-latency settings), preference অনুযায়ী সাজানো
+        self.hw_encoders = {
+            'h264_nvenc': ['-c:v', 'h264_nvenc', '-preset', 'p4', '-tune', 'll'],
+            'h264_qsv': ['-c:v', 'h264_qsv', '-preset', 'veryfast', '-look_ahead', '0'],
+            'h264_vaapi': ['-vaapi_device', '/dev/dri/renderD128', '-c:v', 'h264_vaapi']
+        }
+        self.hw_encoder = None
+        self.video_info = {}
+        
+        log.info(f"✅ Stream Key: {self.stream_key[:8]}...{self.stream_key[-4:]}")
+        log.info(f"✅ Video URL: {self.video_url[:50]}...")
+        log.info(f"✅ Quality: {self.video_quality}")
+        log.info("=" * 60)
         
         self.process = None
+        self._ffmpeg = 'ffmpeg'  # check_ffmpeg() full path বসাবে
         signal.signal(signal.SIGTERM, self.handle_shutdown)
         signal.signal(signal.SIGINT, self.handle_shutdown)
     
     def handle_shutdown(self, signum, frame):
-        print("\n⚠️ Shutdown signal received...")
-        print("🔄 Stream will auto-restart in next workflow run!")
+        log.warning("⚠️ Shutdown signal received...")
+        log.info("🔄 Stream will auto-restart in next workflow run!")
         if self.process:
             self.process.terminate()
         sys.exit(0)
     
     def download_video(self):
         """Video download করুন (যদি local না থাকে)"""
-        print("📥 Checking video file...")
+        log.info("📥 Checking video file...")
         
         video_file = "stream_video.mp4"
         
         if os.path.exists(video_file):
-            file_size = os.path.getsize(video_file) / (1024 * 1024)  # MB
-            print(f"✅ Video already exists: {video_file} ({file_size:.1f} MB)")
-            return video_file
+            if self.is_video_complete(video_file):
+                file_size = os.path.getsize(video_file) / (1024 * 1024)  # MB
+                log.info(f"✅ Video already exists: {video_file} ({file_size:.1f} MB)")
+                return video_file
+            
+            log.warning("⚠️  Cached video size mismatch, downloading again...")
+            os.remove(video_file)
         
-        print("📥 Downloading video from URL...")
-        print("⏳ This may take a few minutes...")
+        log.info("📥 Downloading video from URL...")
+        log.info("⏳ This may take a few minutes...")
         
         try:
-            response = requests.get(self.video_url, stream=True, timeout=60)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            
-            with open(video_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size > 0:
-                            progress = (downloaded / total_size) * 100
-                            mb_downloaded = downloaded / (1024 * 1024)
-                            mb_total = total_size / (1024 * 1024)
-                            print(f"\r📥 Downloading: {progress:.1f}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)", 
-                                  end="", flush=True)
+            with _SESSION.get(self.video_url, stream=True, timeout=60) as response, \
+                    open(video_file, 'wb', buffering=1 << 22) as f:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                total_size = int(response.headers.get('content-length', 0))
+                
+                # Progress আলাদা thread থেকে দেখান, copy loop যেন না থামে
+                done = threading.Event()
+                reporter = threading.Thread(
+                    target=self._report_progress,
+                    args=(f, total_size, done),
+                    daemon=True
+                )
+                reporter.start()
+                try:
+                    shutil.copyfileobj(response.raw, f, 1 << 20)
+                finally:
+                    done.set()
+                    reporter.join()
             
-            print(f"\n✅ Video downloaded successfully!")
+            log.info(f"✅ Video downloaded successfully!")
             return video_file
             
         except Exception as e:
-            print(f"\n❌ Download failed: {e}")
-            print("\n💡 Tips:")
-            print("  - Make sure VIDEO_URL is a direct download link")
-            print("  - For Google Drive: use https://drive.google.com/uc?export=download&id=FILE_ID")
-            print("  - For Dropbox: change ?dl=0 to ?dl=1")
+            log.error(f"❌ Download failed: {e}")
+            # Half-downloaded file রাখবেন না
+            if os.path.exists(video_file):
+                os.remove(video_file)
+            log.info("💡 Tips:")
+            log.info("  - Make sure VIDEO_URL is a direct download link")
+            log.info("  - For Google Drive: use https://drive.google.com/uc?export=download&id=FILE_ID")
+            log.info("  - For Dropbox: change ?dl=0 to ?dl=1")
             sys.exit(1)
     
+    def is_video_complete(self, video_file):
+        """HEAD request এর Content-Length দিয়ে cached video check করুন"""
+        try:
+            response = _SESSION.head(self.video_url, allow_redirects=True, timeout=15)
+            response.raise_for_status()
+            total_size = int(response.headers.get('content-length', 0))
+        except Exception:
+            # Server check করা না গেলে cached file ই ব্যবহার করুন
+            return True
+        
+        return total_size == 0 or total_size == os.path.getsize(video_file)
+    
+    def _report_progress(self, f, total_size, done):
+        """Download progress দেখান (সর্বোচ্চ প্রতি 2 সেকেন্ডে, 4 MB এগোলে)"""
+        last = 0
+        while not done.wait(2):
+            downloaded = f.tell()
+            # আগের print এর পর অন্তত 4 MB না এগোলে log এ নতুন line নয়
+            if total_size > 0 and downloaded >> 22 != last >> 22:
+                last = downloaded
+                progress = (downloaded / total_size) * 100
+                mb_downloaded = downloaded / (1024 * 1024)
+                mb_total = total_size / (1024 * 1024)
+                log.info(f"📥 Downloading: {progress:.1f}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)")
+    
     def check_ffmpeg(self):
-        """FFmpeg check করুন"""
+        """FFmpeg check করুন (PATH এ খুঁজুন, process চালানো লাগবে না)"""
+        path = shutil.which('ffmpeg')
+        if path:
+            self._ffmpeg = path
+            log.info("✅ FFmpeg found!")
+            return True
+        
+        log.error("❌ FFmpeg not found!")
+        log.info("💡 Installing FFmpeg...")
+        return False
+    
+    def probe_video(self, video_file):
+        """ffprobe দিয়ে codec/resolution/keyframe বের করুন (JSON file এ cache)"""
+        info_file = os.path.splitext(video_file)[0] + '.json'
+        
+        if os.path.exists(info_file) and os.path.getmtime(info_file) >= os.path.getmtime(video_file):
+            with open(info_file) as f:
+                info = json.load(f)
+            # পুরোনো cache এ keyframe info না থাকলে আবার probe করুন
+            if 'keyframe_interval' in info:
+                return info
+        
         try:
-            result = subprocess.run(['ffmpeg', '-version'], 
-                                  capture_output=True, timeout=5)
-            if result.returncode == 0:
-                print("✅ FFmpeg found!")
-                return True
-        except:
+            result = subprocess.run(['ffprobe', '-v', 'error',
+                                     '-show_entries', 'stream=codec_type,codec_name,width,height,bit_rate,pix_fmt,r_frame_rate',
+                                     '-of', 'json', video_file],
+                                  capture_output=True, text=True, timeout=30)
+            streams = json.loads(result.stdout)['streams']
+            
+            # প্রথম 20 সেকেন্ডের video packet থেকে keyframe spacing
+            result = subprocess.run(['ffprobe', '-v', 'error', '-select_streams', 'v:0',
+                                     '-read_intervals', '%+20',
+                                     '-show_entries', 'packet=pts_time,flags',
+                                     '-of', 'json', video_file],
+                                  capture_output=True, text=True, timeout=30)
+            packets = json.loads(result.stdout).get('packets', [])
+        except Exception:
+            log.warning("⚠️  ffprobe failed, video will be re-encoded")
+            return {}
+        
+        # প্রথম video আর audio stream রাখুন
+        info = {}
+        for stream in streams:
+            info.setdefault(stream.get('codec_type'), stream)
+        
+        # Keyframe একটার বেশি না পেলে interval অজানা (None) - copy করা যাবে না
+        keyframes = sorted(float(packet['pts_time']) for packet in packets
+                           if 'K' in packet.get('flags', '')
+                           and packet.get('pts_time', 'N/A') != 'N/A')
+        gaps = [b - a for a, b in zip(keyframes, keyframes[1:])]
+        info['keyframe_interval'] = max(gaps) if gaps else None
+        
+        with open(info_file, 'w') as f:
+            json.dump(info, f)
+        
+        return info
+    
+    def prefetch_video(self, video_file, size=64 * 1024 * 1024):
+        """Video এর শুরু page cache এ আগেই load করুন (Linux only)"""
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        
+        fd = os.open(video_file, os.O_RDONLY)
+        try:
+            # Page cache shared, তাই FFmpeg এর নিজের fd ও এটা পাবে
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+        except OSError:
             pass
+        finally:
+            os.close(fd)
+    
+    def can_stream_copy(self):
+        """Video already YouTube-ready (h264 yuv420p, target size/fps, keyframe ≤ 4s) কিনা"""
+        video = self.video_info.get('video', {})
         
-        print("❌ FFmpeg not found!")
-        print("💡 Installing FFmpeg...")
-        return False
+        if video.get('codec_name') != 'h264' or video.get('pix_fmt') != 'yuv420p':
+            return False
+        if f"{video.get('width')}x{video.get('height')}" != self.settings['size']:
+            return False
+        
+        # Frame rate target এর কাছাকাছি হতে হবে (29.97 ≈ 30)
+        try:
+            num, den = video['r_frame_rate'].split('/')
+            fps = int(num) / int(den)
+        except (KeyError, ValueError, ZeroDivisionError):
+            return False
+        if abs(fps - self.settings['fps']) > 1:
+            return False
+        
+        # YouTube 4 সেকেন্ডের বেশি keyframe interval এ buffer করে
+        keyframe_interval = self.video_info.get('keyframe_interval')
+        if keyframe_interval is None or keyframe_interval > 4:
+            return False
+        
+        # Bitrate অজানা বা target এর দ্বিগুণের বেশি হলে re-encode করুন
+        if not str(video.get('bit_rate', '')).isdigit():
+            return False
+        return int(video['bit_rate']) <= self.settings['bitrate_bps'] * 2
+    
+    def detect_hw_encoder(self):
+        """Hardware H.264 encoder খুঁজুন (NVENC/QuickSync/VAAPI)"""
+        try:
+            result = subprocess.run([self._ffmpeg, '-hide_banner', '-encoders'],
+                                  capture_output=True, text=True, timeout=10)
+        except Exception:
+            return None
+        
+        for encoder in self.hw_encoders:
+            if encoder not in result.stdout:
+                continue
+            
+            # Build এ encoder থাকলেই GPU থাকবে এমন না - stream এর আসল
+            # encoding args দিয়েই কয়েকটা frame encode করে দেখুন
+            test_cmd = [self._ffmpeg, '-hide_banner', '-loglevel', 'error',
+                        '-f', 'lavfi', '-i', 'color=size=256x256',
+                        '-frames:v', '5', *self.video_encode_args(encoder),
+                        '-f', 'null', '-']
+            
+            try:
+                test = subprocess.run(test_cmd, capture_output=True, timeout=15)
+            except Exception:
+                continue
+            if test.returncode == 0:
+                log.info(f"✅ Hardware encoder found: {encoder}")
+                return encoder
+        
+        log.info("💡 No hardware encoder, using libx264")
+        return None
+    
+    def video_encode_args(self, encoder=None):
+        """Video encoding args তৈরি করুন (encoder None মানে libx264)"""
+        # Video encoder - hardware থাকলে সেটা, না হলে libx264
+        if encoder:
+            video_codec = self.hw_encoders[encoder]
+        else:
+            video_codec = ['-c:v', 'libx264',
+                           '-preset', 'faster',
+                           '-tune', 'zerolatency',  # No look-ahead/B-frame delay
+                           # CBR HRD + sliced threads (একটা frame সব core এ ভাগ করে)
+                           '-x264-params', f"nal-hrd=cbr:sliced-threads=1:threads={os.cpu_count() or 1}:rc-lookahead=0"]
+        
+        if encoder == 'h264_vaapi':
+            # VAAPI: CPU তে scale করে GPU memory তে upload
+            video_format = ['-vf', f"scale={self.settings['size'].replace('x', ':')},format=nv12,hwupload"]
+        elif encoder == 'h264_qsv':
+            # QuickSync yuv420p নেয় না - একই 4:2:0, তবে nv12 layout
+            video_format = ['-s', self.settings['size'], '-pix_fmt', 'nv12']
+        else:
+            video_format = ['-s', self.settings['size'], '-pix_fmt', 'yuv420p']
+        
+        return [
+            *video_codec,
+            '-b:v', self.settings['bitrate'],
+            '-maxrate', self.settings['bitrate'],
+            '-bufsize', self.settings['bufsize'],
+            *video_format,
+            '-r', str(self.settings['fps']),
+            '-g', self.settings['gop']  # Keyframe interval
+        ]
     
     def build_ffmpeg_command(self, video_file):
         """FFmpeg command তৈরি করুন - Optimized for stability"""
+        if self.can_stream_copy():
+            # Video already stream-ready - re-encode না করে শুধু remux
+            video_args = ['-c:v', 'copy']
+        else:
+            video_args = self.video_encode_args(self.hw_encoder)
+        
+        input_args = ['-re',  # Real-time streaming
+                      '-thread_queue_size', '1024']
+        
+        if self.can_stream_copy() and self.video_info.get('audio', {}).get('codec_name') == 'aac':
+            audio_args = ['-c:a', 'copy']
+        else:
+            audio_args = [
+                '-c:a', 'aac',
+                '-b:a', '128k',
+                '-ar', '44100',
+                '-ac', '2'
+            ]
+        
         cmd = [
-            'ffmpeg',
-            '-re',  # Real-time streaming
+            self._ffmpeg,
+            '-loglevel', 'error',  # stderr এ শুধু error
+            '-nostats',
+            '-progress', 'pipe:1',  # Structured progress on stdout
+            *input_args,
             '-stream_loop', '-1',  # Infinite loop
             '-i', video_file,
             
             # Video encoding - optimized for stability
-            '-c:v', 'libx264',
-            '-preset', 'veryfast',
-            '-b:v', self.settings['bitrate'],
-            '-maxrate', self.settings['bitrate'],
-            '-bufsize', f"{int(self.settings['bitrate'][:-1]) * 2}k",
-            '-s', self.settings['size'],
-            '-r', str(self.settings['fps']),
-            '-g', str(self.settings['fps'] * 2),  # Keyframe interval
-            '-pix_fmt', 'yuv420p',
+            *video_args,
             
             # Audio encoding
-            '-c:a', 'aac',
-            '-b:a', '128k',
-            '-ar', '44100',
-            '-ac', '2',
+            *audio_args,
             
             # Streaming optimizations for reconnection
             '-f', 'flv',
@@ -160,125 +390,164 @@ class YouTubeLiveStreamer:
         
         return cmd
     
-    def start_streaming(self):
+    def _request_stop(self):
+        """SIGTERM/SIGINT - supervisor কে এখনই থামতে বলুন"""
+        log.warning("⚠️ Shutdown signal received...")
+        log.info("🔄 Stream will auto-restart in next workflow run!")
+        self._stop.set()
+        if self.process and self.process.returncode is None:
+            self.process.terminate()
+    
+    async def _wait_or_stop(self, seconds):
+        """Backoff wait - shutdown হলে সাথে সাথে True return করে"""
+        try:
+            await asyncio.wait_for(self._stop.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+        return self._stop.is_set()
+    
+    async def start_streaming(self):
         """Live streaming শুরু করুন"""
         
         # FFmpeg check
         if not self.check_ffmpeg():
-            print("❌ Please install FFmpeg first!")
+            log.error("❌ Please install FFmpeg first!")
             sys.exit(1)
         
         # Video download/check
         video_file = self.download_video()
+        self.video_info = self.probe_video(video_file)
+        self.prefetch_video(video_file)
+        
+        if self.can_stream_copy():
+            log.info("✅ Video is stream-ready, no re-encoding needed!")
+        else:
+            # Hardware encoder check
+            self.hw_encoder = self.detect_hw_encoder()
         
         # Build command
         cmd = self.build_ffmpeg_command(video_file)
         
-        print("\n" + "=" * 60)
-        print("🚀 Starting 24/7 YouTube Live Stream")
-        print("=" * 60)
-        print(f"📺 Quality: {self.video_quality}")
-        print(f"♾️  Loop mode: ENABLED")
-        print(f"🔄 Auto-reconnect: ENABLED")
-        print(f"⏰ Duration: Will run for ~5.5 hours")
-        print(f"🔁 Next restart: Automatic (via GitHub Actions)")
-        print("=" * 60)
-        print("💡 Your PC can be OFF - this runs on GitHub servers!")
-        print("=" * 60 + "\n")
+        log.info("=" * 60)
+        log.info("🚀 Starting 24/7 YouTube Live Stream")
+        log.info("=" * 60)
+        log.info(f"📺 Quality: {self.video_quality}")
+        log.info(f"♾️  Loop mode: ENABLED")
+        log.info(f"🔄 Auto-reconnect: ENABLED")
+        log.info(f"⏰ Duration: Will run for ~5.5 hours")
+        log.info(f"🔁 Next restart: Automatic (via GitHub Actions)")
+        log.info("=" * 60)
+        log.info("💡 Your PC can be OFF - this runs on GitHub servers!")
+        log.info("=" * 60)
         
         retry_count = 0
         max_retries = 50  # More retries for stability
         
-        while True:
+        # Streaming চলাকালীন signal গুলো event loop এ আসবে
+        self._stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGTERM, self._request_stop)
+        loop.add_signal_handler(signal.SIGINT, self._request_stop)
+        
+        while not self._stop.is_set():
             try:
                 if retry_count > 0:
-                    print(f"\n🔄 Reconnection attempt #{retry_count}")
+                    log.info(f"🔄 Reconnection attempt #{retry_count}")
                 
-                print(f"🎬 Stream starting at {datetime.now()}")
+                log.info(f"🎬 Stream starting at {datetime.now()}")
                 
                 # Start FFmpeg process
-                self.process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True,
-                    bufsize=1
+                self.process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=None  # শুধু error আসে (-loglevel error), সরাসরি log এ যাক
                 )
                 
                 # Monitor process and show output
-                last_output_time = time.time()
-                
-                for line in iter(self.process.stdout.readline, ''):
-                    if line:
-                        # Show important FFmpeg output
-                        if 'frame=' in line or 'speed=' in line:
-                            print(f"\r⚡ {line.strip()[:80]}", end="", flush=True)
-                            last_output_time = time.time()
-                        elif 'error' in line.lower() or 'failed' in line.lower():
-                            print(f"\n⚠️  {line.strip()}")
-                    
-                    # Check if process is still running
-                    if self.process.poll() is not None:
-                        break
-                    
-                    # Timeout check (if no output for 2 minutes)
-                    if time.time() - last_output_time > 120:
-                        print("\n⚠️  No output for 2 minutes, restarting...")
+                while True:
+                    try:
+                        # Timeout check (if no progress for 2 minutes)
+                        # প্রতিটা block 'progress=...' দিয়ে শেষ হয়, তাই line প্রতি
+                        # নয় - block প্রতি একটাই timer
+                        block = await asyncio.wait_for(
+                            self.process.stdout.readuntil(b'\nprogress='), 120)
+                    except asyncio.TimeoutError:
+                        log.warning("⚠️  No progress for 2 minutes, restarting...")
                         self.process.terminate()
                         break
+                    except asyncio.IncompleteReadError:
+                        # FFmpeg output বন্ধ করেছে (process ended)
+                        break
+                    
+                    # Show FFmpeg progress (শুধু LOG_LEVEL=DEBUG এ)
+                    if log.isEnabledFor(logging.DEBUG):
+                        status = b' '.join(key + b'=' + value for key, value in STATUS_FIELD.findall(block))
+                        log.debug("⚡ %s", status.decode(errors='replace'))
                 
                 # Process ended
-                return_code = self.process.returncode
+                return_code = await self.process.wait()
                 
-                print(f"\n⚠️  Stream ended with code: {return_code}")
+                log.warning(f"⚠️  Stream ended with code: {return_code}")
+                
+                if self._stop.is_set():
+                    break
                 
                 retry_count += 1
                 
                 if retry_count >= max_retries:
-                    print(f"\n✅ Reached max retries. Workflow will restart automatically.")
-                    print(f"🔄 Next run scheduled in ~30 minutes (via GitHub Actions)")
+                    log.info(f"✅ Reached max retries. Workflow will restart automatically.")
+                    log.info(f"🔄 Next run scheduled in ~30 minutes (via GitHub Actions)")
                     break
                 
                 # Exponential backoff
                 wait_time = min(retry_count * 5, 30)
-                print(f"🔄 Reconnecting in {wait_time} seconds...")
-                time.sleep(wait_time)
+                log.info(f"🔄 Reconnecting in {wait_time} seconds...")
+                if await self._wait_or_stop(wait_time):
+                    break
                     
-            except KeyboardInterrupt:
-                print("\n⚠️  Stopped by user (or workflow timeout)")
-                print("🔄 Next run will start automatically")
-                break
             except Exception as e:
-                print(f"\n❌ Error: {e}")
+                log.error(f"❌ Error: {e}")
                 retry_count += 1
                 
                 if retry_count >= max_retries:
-                    print(f"\n✅ Max retries reached. Exiting gracefully.")
+                    log.info(f"✅ Max retries reached. Exiting gracefully.")
                     break
                 
-                time.sleep(10)
+                if await self._wait_or_stop(10):
+                    break
         
-        print("\n" + "=" * 60)
-        print("👋 Stream session ended")
-        print("🔄 GitHub Actions will automatically start next session")
-        print("=" * 60)
+        log.info("=" * 60)
+        log.info("👋 Stream session ended")
+        log.info("🔄 GitHub Actions will automatically start next session")
+        log.info("=" * 60)
+
+def setup_logging():
+    """Logging চালু করুন - LOG_LEVEL=DEBUG দিলে প্রতিটা FFmpeg progress দেখাবে"""
+    level = (os.getenv('LOG_LEVEL') or 'INFO').upper()
+    # অচেনা level এ basicConfig ValueError দেয় - INFO তে fallback করুন
+    valid = isinstance(logging.getLevelName(level), int)
+    logging.basicConfig(level=level if valid else logging.INFO,
+                        format='%(asctime)s %(message)s')
+    if not valid:
+        log.warning(f"⚠️  Unknown LOG_LEVEL '{level}', using INFO")
 
 def main():
     """Main function"""
-    print("\n" + "=" * 60)
-    print("🎬 YouTube 24/7 Live Streamer")
-    print("=" * 60)
-    print("✅ Runs on GitHub Actions (FREE)")
-    print("✅ PC বন্ধ থাকলেও চলবে!")
-    print("✅ Auto-restart every 5.5 hours")
-    print("♾️  Infinite loop streaming")
-    print("=" * 60 + "\n")
+    setup_logging()
+    log.info("=" * 60)
+    log.info("🎬 YouTube 24/7 Live Streamer")
+    log.info("=" * 60)
+    log.info("✅ Runs on GitHub Actions (FREE)")
+    log.info("✅ PC বন্ধ থাকলেও চলবে!")
+    log.info("✅ Auto-restart every 5.5 hours")
+    log.info("♾️  Infinite loop streaming")
+    log.info("=" * 60)
     
     try:
         streamer = YouTubeLiveStreamer()
-        streamer.start_streaming()
+        asyncio.run(streamer.start_streaming())
     except Exception as e:
-        print(f"\n❌ Fatal error: {e}")
+        log.error(f"❌ Fatal error: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":